@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
@@ -21,86 +23,73 @@ async def async_setup_entry(
 ) -> None:
     """Set up ecobee binary (occupancy) sensors."""
     data = hass.data[DOMAIN]
-    dev = []
-    for index in range(len(data.ecobee.thermostats)):
-        for sensor in data.ecobee.get_remote_sensors(index):
-            for item in sensor["capability"]:
-                if item["type"] != "occupancy":
-                    continue
-
-                dev.append(EcobeeBinarySensor(data, sensor["name"], index))
+    dev = [
+        EcobeeBinarySensor(data, sensor, index)
+        for index in range(len(data.ecobee.thermostats))
+        for sensor in data.ecobee.get_remote_sensors(index)
+        if any(item["type"] == "occupancy" for item in sensor["capability"])
+    ]
 
     async_add_entities(dev, True)
 
 
+def _occupancy_index(sensor: dict[str, Any]) -> int | None:
+    """Return the position of the occupancy capability of a sensor."""
+    for index, item in enumerate(sensor["capability"]):
+        if item["type"] == "occupancy":
+            return index
+    return None
+
+
 class EcobeeBinarySensor(BinarySensorEntity):
     """Representation of an Ecobee sensor."""
 
     _attr_device_class = BinarySensorDeviceClass.OCCUPANCY
     _attr_has_entity_name = True
 
-    def __init__(self, data, sensor_name, sensor_index):
+    def __init__(self, data, sensor, sensor_index):
         """Initialize the Ecobee sensor."""
         self.data = data
-        self.sensor_name = sensor_name.rstrip()
+        self._sensor_key = sensor["name"]
         self.index = sensor_index
-
-    @property
-    def unique_id(self):
-        """Return a unique identifier for this sensor."""
-        for sensor in self.data.ecobee.get_remote_sensors(self.index):
-            if sensor["name"] == self.sensor_name:
-                if "code" in sensor:
-                    return f"{sensor['code']}-{self.device_class}"
-                thermostat = self.data.ecobee.get_thermostat(self.index)
-                return f"{thermostat['identifier']}-{sensor['id']}-{self.device_class}"
-
-    @property
-    def device_info(self) -> DeviceInfo | None:
-        """Return device information for this sensor."""
-        identifier = None
-        model = None
-        for sensor in self.data.ecobee.get_remote_sensors(self.index):
-            if sensor["name"] != self.sensor_name:
-                continue
-            if "code" in sensor:
-                identifier = sensor["code"]
-                model = "ecobee Room Sensor"
-            else:
-                thermostat = self.data.ecobee.get_thermostat(self.index)
-                identifier = thermostat["identifier"]
-                try:
-                    model = (
-                        f"{ECOBEE_MODEL_TO_NAME[thermostat['modelNumber']]} Thermostat"
-                    )
-                except KeyError:
-                    # Ecobee model is not in our list
-                    model = None
-            break
-
-        if identifier is not None:
-            return DeviceInfo(
-                identifiers={(DOMAIN, identifier)},
-                manufacturer=MANUFACTURER,
-                model=model,
-                name=self.sensor_name,
-            )
-        return None
-
-    @property
-    def available(self) -> bool:
-        """Return true if device is available."""
-        thermostat = self.data.ecobee.get_thermostat(self.index)
-        return thermostat["runtime"]["connected"]
+        self._occupancy_index = _occupancy_index(sensor)
+        if "code" in sensor:
+            identifier = sensor["code"]
+            model = "ecobee Room Sensor"
+            self._attr_unique_id = f"{identifier}-{self.device_class}"
+        else:
+            thermostat = data.ecobee.get_thermostat(sensor_index)
+            identifier = thermostat["identifier"]
+            try:
+                model = f"{ECOBEE_MODEL_TO_NAME[thermostat['modelNumber']]} Thermostat"
+            except KeyError:
+                # Ecobee model is not in our list
+                model = None
+            self._attr_unique_id = f"{identifier}-{sensor['id']}-{self.device_class}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, identifier)},
+            manufacturer=MANUFACTURER,
+            model=model,
+            name=sensor["name"].rstrip(),
+        )
 
     async def async_update(self) -> None:
         """Get the latest state of the sensor."""
         await self.data.update()
+        thermostat = self.data.ecobee.get_thermostat(self.index)
+        self._attr_available = thermostat["runtime"]["connected"]
         for sensor in self.data.ecobee.get_remote_sensors(self.index):
-            if sensor["name"] != self.sensor_name:
+            if sensor["name"] != self._sensor_key:
                 continue
-            for item in sensor["capability"]:
-                if item["type"] != "occupancy":
-                    continue
-                self._attr_is_on = item["value"] == "true"
-                break
+            capability = sensor["capability"]
+            index = self._occupancy_index
+            if (
+                index is None
+                or index >= len(capability)
+                or capability[index]["type"] != "occupancy"
+            ):
+                # The capability layout changed, locate the occupancy entry again
+                index = self._occupancy_index = _occupancy_index(sensor)
+            if index is not None:
+                self._attr_is_on = capability[index]["value"] == "true"
+            break
@@ -0,0 +1,157 @@
+"""The test for the ecobee binary sensor module."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from homeassistant.components.binary_sensor import DOMAIN
+from homeassistant.components.ecobee.binary_sensor import (
+    EcobeeBinarySensor,
+    async_setup_entry,
+)
+from homeassistant.components.ecobee.const import DOMAIN as ECOBEE_DOMAIN
+from homeassistant.const import STATE_OFF
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from .common import setup_platform
+
+OCCUPANCY_ID = "binary_sensor.remote_sensor_1_occupancy"
+
+
+def _thermostat_sensor(name: str = "ecobee") -> dict:
+    """Return a thermostat-internal sensor, which has no room sensor code."""
+    return {
+        "id": "ei:0",
+        "name": name,
+        "type": "thermostat",
+        "capability": [{"id": "2", "type": "occupancy", "value": "true"}],
+    }
+
+
+def _mock_data(model_number: str) -> MagicMock:
+    """Return mocked ecobee data with a single thermostat."""
+    data = MagicMock()
+    data.ecobee.get_thermostat.return_value = {
+        "identifier": "8675309",
+        "modelNumber": model_number,
+        "runtime": {"connected": True},
+    }
+    return data
+
+
+async def test_occupancy_sensor_attributes(hass: HomeAssistant) -> None:
+    """Test the occupancy binary sensor attributes are correct."""
+    await setup_platform(hass, DOMAIN)
+
+    state = hass.states.get(OCCUPANCY_ID)
+    assert state.state == STATE_OFF
+    assert state.attributes.get("device_class") == "occupancy"
+    assert state.attributes.get("friendly_name") == "Remote Sensor 1 Occupancy"
+
+
+async def test_occupancy_sensor_registry(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    device_registry: dr.DeviceRegistry,
+) -> None:
+    """Test the occupancy binary sensor unique id and device info."""
+    await setup_platform(hass, DOMAIN)
+
+    entry = entity_registry.async_get(OCCUPANCY_ID)
+    assert entry.unique_id == "WKRP-occupancy"
+
+    device = device_registry.async_get(entry.device_id)
+    assert device.identifiers == {("ecobee", "WKRP")}
+    assert device.manufacturer == "ecobee"
+    assert device.model == "ecobee Room Sensor"
+    assert device.name == "Remote Sensor 1"
+
+
+@pytest.mark.parametrize(
+    ("model_number", "model"),
+    [
+        ("athenaSmart", "ecobee3 Smart Thermostat"),
+        ("unknownEcobeeModel", None),
+    ],
+)
+def test_thermostat_sensor_identity(model_number: str, model: str | None) -> None:
+    """Test a thermostat-internal sensor uses the thermostat identifier."""
+    sensor = EcobeeBinarySensor(_mock_data(model_number), _thermostat_sensor(), 0)
+
+    assert sensor.unique_id == "8675309-ei:0-occupancy"
+    assert sensor.device_info["identifiers"] == {("ecobee", "8675309")}
+    assert sensor.device_info["model"] == model
+    assert sensor.device_info["name"] == "ecobee"
+
+
+async def test_sensor_name_with_trailing_whitespace() -> None:
+    """Test a sensor whose name ends in whitespace is registered and updated."""
+    data = _mock_data("athenaSmart")
+    data.update = AsyncMock()
+    sensor_data = _thermostat_sensor("ecobee ")
+    data.ecobee.get_remote_sensors.return_value = [sensor_data]
+
+    sensor = EcobeeBinarySensor(data, sensor_data, 0)
+    assert sensor.unique_id == "8675309-ei:0-occupancy"
+    assert sensor.device_info["name"] == "ecobee"
+
+    await sensor.async_update()
+    assert sensor.is_on is True
+
+
+async def test_update_capability_layout_change() -> None:
+    """Test the occupancy value is still found if the capabilities move."""
+    data = _mock_data("athenaSmart")
+    data.update = AsyncMock()
+    sensor_data = _thermostat_sensor()
+    data.ecobee.get_remote_sensors.return_value = [sensor_data]
+    sensor = EcobeeBinarySensor(data, sensor_data, 0)
+
+    await sensor.async_update()
+    assert sensor.is_on is True
+
+    data.ecobee.get_remote_sensors.return_value = [
+        {
+            **sensor_data,
+            "capability": [
+                {"id": "1", "type": "temperature", "value": "720"},
+                {"id": "2", "type": "occupancy", "value": "false"},
+            ],
+        }
+    ]
+    await sensor.async_update()
+    assert sensor.is_on is False
+
+
+async def test_update_available() -> None:
+    """Test availability follows the thermostat connection on update."""
+    data = _mock_data("athenaSmart")
+    data.update = AsyncMock()
+    sensor_data = _thermostat_sensor()
+    data.ecobee.get_remote_sensors.return_value = [sensor_data]
+    sensor = EcobeeBinarySensor(data, sensor_data, 0)
+
+    await sensor.async_update()
+    assert sensor.available is True
+
+    data.ecobee.get_thermostat.return_value["runtime"]["connected"] = False
+    await sensor.async_update()
+    assert sensor.available is False
+
+
+async def test_setup_one_entity_per_sensor(hass: HomeAssistant) -> None:
+    """Test a sensor listing occupancy twice only creates one entity."""
+    data = _mock_data("athenaSmart")
+    data.ecobee.thermostats = [{}]
+    sensor_data = _thermostat_sensor()
+    sensor_data["capability"].append({"id": "3", "type": "occupancy", "value": "true"})
+    data.ecobee.get_remote_sensors.return_value = [sensor_data]
+    hass.data[ECOBEE_DOMAIN] = data
+    add_entities = MagicMock()
+
+    await async_setup_entry(hass, MagicMock(), add_entities)
+
+    entities, update_before_add = add_entities.call_args.args
+    assert len(entities) == 1
+    assert update_before_add is True